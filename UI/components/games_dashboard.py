@@ -35,7 +35,7 @@ class ClickableFrame(QFrame):
         self.func = func
         self.args = args
         self.kwargs = kwargs
-        self.api_client = APIClient()
+        self.api_client = APIClient.instance()
         self.setFixedSize(420, 220)
 
         self.setup_card_ui()
@@ -610,7 +610,7 @@ class AddNewGameWindow(QDialog):
     def __init__(self, parent = None, edit=None, **kwargs):
         super().__init__(parent)
         self.kwargs = kwargs
-        self.api_client = APIClient()
+        self.api_client = APIClient.instance()
         self.edit = edit
         self.setWindowTitle("Добавить новую игру" if self.edit is None else "Редактирование игры")
         self.setModal(True)
@@ -819,7 +819,7 @@ class GamesDashboard(QWidget):
     Использует ClickableFrame для отображения каждой игры и FlowLayout для компоновки."""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.api_client = APIClient()
+        self.api_client = APIClient.instance()
         self.setStyleSheet("background-color: #29292A;")
 
         # === СКРОЛЛИРУЕМАЯ ОБЛАСТЬ ===
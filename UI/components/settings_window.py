@@ -1,90 +1,199 @@
 # Copyright (C) 2025 IAMVanilka
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import asyncio
 import json
 import os
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from urllib.parse import urlsplit
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
-                               QLineEdit, QPushButton, QListWidget,
-                               QListWidgetItem, QGroupBox, QTextEdit, QSizePolicy)
-from PySide6.QtCore import Qt
+                               QLineEdit, QPushButton, QListView,
+                               QGroupBox, QTextEdit, QSizePolicy, QStyledItemDelegate)
+from PySide6.QtGui import QBrush, QPalette
+from PySide6.QtCore import Qt, QTimer, Signal, QAbstractListModel, QModelIndex
 
 from modules.ui_controllers.async_runner import AsyncRunner
 from modules.ui_controllers.main_controller import get_backups_data_action, restore_backup_action, delete_backup_action
 from modules.API_client import APIClient
 
-class SettingsWindow(QWidget):
+CONFIG_FILE = "settings.json"
+
+HEADER_ITEM = "header"
+BACKUP_ITEM = "backup"
+
+class BackupItemTag:
+    """Данные элемента списка бэкапов: заголовок игры или конкретный бэкап"""
+    __slots__ = ("kind", "game", "backup")
+
+    def __init__(self, kind, game, backup=None):
+        self.kind = kind
+        self.game = game
+        self.backup = backup
+
+def format_bytes(size_bytes):
+    """Преобразует размер в байтах в человеко-читаемый формат"""
+    if size_bytes < 1024:
+        return f"{size_bytes} Б"
+    elif size_bytes < 1024 ** 2:
+        return f"{size_bytes / 1024:.2f} КБ"
+    elif size_bytes < 1024 ** 3:
+        return f"{size_bytes / (1024 ** 2):.2f} МБ"
+    else:
+        return f"{size_bytes / (1024 ** 3):.2f} ГБ"
+
+class BackupItemDelegate(QStyledItemDelegate):
+    """Отрисовка списка бэкапов: заголовки игр выделяются цветом прямо при отрисовке,
+    без отдельных кистей и изменений данных у каждого элемента"""
+    HEADER_BACKGROUND = QBrush(Qt.darkGray)
+    HEADER_FOREGROUND = QBrush(Qt.white)
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        tag = index.data(Qt.UserRole)
+        if tag is not None and tag.kind == HEADER_ITEM:
+            option.backgroundBrush = self.HEADER_BACKGROUND
+            option.palette.setBrush(QPalette.Text, self.HEADER_FOREGROUND)
+
+class BackupsModel(QAbstractListModel):
+    """Плоский список строк бэкапов: заголовок игры, за ним её бэкапы, если игра развёрнута.
+    Сворачивание/разворачивание вставляет или удаляет только строки одной игры"""
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.api_client = APIClient()
-        self.expanded_games = set()
+        self._backups_data = {}
+        self._expanded_games = set()
+        self._rows = []
+
+    def set_backups(self, backups_data):
+        """Полная замена данных (после загрузки с сервера). Развёрнутые игры остаются развёрнутыми"""
+        self.beginResetModel()
+        self._backups_data = backups_data
+        self._expanded_games &= backups_data.keys()
+        self._rows = []
+        for game_name in sorted(backups_data):
+            self._rows.append(BackupItemTag(HEADER_ITEM, game_name))
+            if game_name in self._expanded_games:
+                self._rows.extend(self._backup_rows(game_name))
+        self.endResetModel()
+
+    def _backup_rows(self, game_name):
+        return [BackupItemTag(BACKUP_ITEM, game_name, backup) for backup in self._backups_data[game_name]]
+
+    def toggle_game(self, row):
+        """Разворачивает или сворачивает игру, заголовок которой стоит в строке row"""
+        tag = self._rows[row]
+        game_name = tag.game
+        count = len(self._backups_data[game_name])
+
+        if game_name in self._expanded_games:
+            self._expanded_games.discard(game_name)
+            if count:
+                self.beginRemoveRows(QModelIndex(), row + 1, row + count)
+                del self._rows[row + 1:row + 1 + count]
+                self.endRemoveRows()
+        else:
+            self._expanded_games.add(game_name)
+            if count:
+                self.beginInsertRows(QModelIndex(), row + 1, row + count)
+                self._rows[row + 1:row + 1] = self._backup_rows(game_name)
+                self.endInsertRows()
+
+        # У заголовка меняется только иконка папки
+        header_index = self.index(row)
+        self.dataChanged.emit(header_index, header_index, [Qt.DisplayRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        tag = self._rows[index.row()]
+        if role == Qt.UserRole:
+            return tag
+        if role == Qt.DisplayRole:
+            if tag.kind == HEADER_ITEM:
+                folder_icon = "📂" if tag.game in self._expanded_games else "📁"
+                return f"{folder_icon} {tag.game} ({len(self._backups_data[tag.game])} бэкапов)"
+            return f"   📄 {tag.backup['filename']} ({format_bytes(tag.backup['size_bytes'])})"
+        return None
+
+def _read_settings_json() -> dict:
+    """Чтение settings.json"""
+    config_path = Path(CONFIG_FILE)
+    return json.loads(config_path.read_bytes()) if config_path.exists() else {}
+
+async def _load_settings_json() -> dict:
+    """Чтение конфига в потоке-писателе: цикл AsyncRunner не блокируется,
+    а чтение выполняется строго после уже поставленных в очередь записей"""
+    return await asyncio.get_running_loop().run_in_executor(_config_writer, _read_settings_json)
+
+def _write_settings_json(config):
+    """Атомарная запись конфига: пишем во временный файл, сбрасываем на диск и подменяем им settings.json"""
+    config_dir = os.path.dirname(os.path.abspath(CONFIG_FILE))
+    fd, tmp_path = tempfile.mkstemp(dir=config_dir, prefix=".settings.", suffix=".json")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(config, indent=2, ensure_ascii=False))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CONFIG_FILE)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _update_settings_json(updates):
+    """Применение изменений к текущему settings.json: ключи, которых нет в updates, сохраняются.
+    Если файл не читается (например, повреждён), запись не выполняется"""
+    config = _read_settings_json()
+    config.update(updates)
+    _write_settings_json(config)
+
+# Один поток-писатель: записи конфига выполняются строго по очереди, в порядке сохранения
+_config_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ConfigWriter")
+
+class SettingsWindow(QWidget):
+    config_saved = Signal(object)
+
+    def __init__(self, parent=None, api_client=None):
+        super().__init__(parent)
+        self.api_client = api_client or APIClient.instance()
+        self._config = {}
+
+        # Запись конфига откладывается, чтобы серия сохранений превратилась в одну запись на диск.
+        # _pending_config — изменения, ещё не переданные писателю; _config_edits — изменения,
+        # сделанные с начала последнего чтения конфига (их нет в прочитанных с диска данных)
+        self._pending_config = {}
+        self._config_edits = {}
+        self._config_runner = None
+        # Раннеры восстановления живут до получения результата, иначе сигналы из потока цикла теряются
+        self._restore_runners = set()
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.persist_config)
+        self.config_saved.connect(self._on_config_saved)
+
+        # Сообщения статуса копятся и выводятся одной пачкой, чтобы не перерисовывать лог на каждое сообщение
+        self._pending_status = deque()
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status)
+
         self.setup_ui()
         self.load_data()
 
     def setup_ui(self):
         self.setWindowTitle("Настройки")
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #29292A;
-                color: white;
-                font-size: 14px;
-            }
-            QLineEdit {
-                background-color: #3A3A3C;
-                color: white;
-                border: 1px solid #555557;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #4CAF50;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QGroupBox {
-                border: 1px solid #555557;
-                border-radius: 5px;
-                margin-top: 1ex;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subline-offset: -2px;
-                padding: 0 5px;
-                color: #4CAF50;
-            }
-            QListWidget {
-                background-color: #3A3A3C;
-                border: 1px solid #555557;
-                border-radius: 5px;
-                alternate-background-color: #323234;
-            }
-            QListWidget::item {
-                padding: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #1B3CBF;
-            }
-            QTextEdit {
-                background-color: #3A3A3C;
-                border: 1px solid #555557;
-                border-radius: 5px;
-                color: white;
-            }
-        """)
+        self.setObjectName("SettingsWindow")
 
         main_layout = QVBoxLayout()
         main_layout.setSpacing(15)
@@ -149,8 +258,11 @@ class SettingsWindow(QWidget):
         backups_layout.setSpacing(10)
 
         # Список бэкапов
-        self.backups_list = QListWidget()
+        self.backups_model = BackupsModel(self)
+        self.backups_list = QListView()
+        self.backups_list.setModel(self.backups_model)
         self.backups_list.setAlternatingRowColors(True)
+        self.backups_list.setItemDelegate(BackupItemDelegate(self.backups_list))
 
         # Кнопки управления бэкапами
         backup_buttons_layout = QHBoxLayout()
@@ -187,62 +299,70 @@ class SettingsWindow(QWidget):
         status_group.setLayout(status_layout)
         main_layout.addWidget(status_group, stretch=1)
 
-        self.backups_list.itemClicked.connect(self.on_backup_item_clicked)
+        self.backups_list.clicked.connect(self.on_backup_item_clicked)
 
         self.setLayout(main_layout)
 
     def load_data(self):
-        # Загрузка адреса сервера
-        server_address = self.get_server_address()
-        self.server_address_input.setText(server_address)
+        # Загрузка адреса сервера (чтение и разбор JSON идут в фоне)
+        # Раннер хранится в self: иначе он будет удалён до доставки результата из потока цикла
+        self._config_edits = dict(self._pending_config)
+        self._config_runner = AsyncRunner()
+        self._config_runner.result.connect(self._on_config_loaded)
+        self._config_runner.error.connect(self._on_config_load_error)
+        self._config_runner.run_async(_load_settings_json)
 
         # Загрузка токена
         token = self.api_client.get_token()
         self.token_input.setText(token)
 
         async_runner = AsyncRunner()
-        async_runner.result.connect(self.refresh_backups)
+        async_runner.result.connect(self._on_backups_loaded)
 
         async_runner.run_async(get_backups_data_action, self.api_client)
 
-    def get_server_address(self):
-        """Загрузка адреса сервера из JSON файла"""
-        try:
-            config_file = "settings.json"
-            if os.path.exists(config_file):
-                with open(config_file, 'r+', encoding='utf-8') as f:
-                    config = json.load(f)
-                    return config.get("host", "")
-            return ""
-        except Exception as e:
-            self.update_status(f"❌ Ошибка загрузки адреса сервера: {e}")
-            return ""
+    def _on_config_loaded(self, config):
+        """Конфиг прочитан: обновляем кэш и поле адреса сервера"""
+        # Изменения пользователя, сделанные после начала чтения, важнее прочитанных с диска.
+        # Список не очищается здесь: результат более раннего чтения может прийти позже нового
+        config.update(self._config_edits)
+        self._config = config
+        self.server_address_input.setText(self._config.get("host", ""))
+
+    def _on_config_load_error(self, error):
+        self.update_status(f"❌ Ошибка загрузки адреса сервера: {error['exception']}")
 
     def save_server_address_to_config(self):
         """Сохранение адреса сервера в JSON файл"""
-        try:
-            address = self.server_address_input.text().strip()
-
-            config_file = "settings.json"
-            config = {}
-
-            # Загружаем существующий конфиг
-            if os.path.exists(config_file):
-                with open(config_file, 'r+', encoding='utf-8') as f:
-                    config = json.load(f)
-
-            # Обновляем адрес
-            config["host"] = address
-
-            # Сохраняем
-            with open(config_file, 'w+', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-
-            self.api_client.load_host()
-            self.update_status(f"✅ Адрес {address} был сохранен в конфиг!")
-
-        except Exception as e:
-            self.update_status(f"❌ Ошибка сохранения адреса сервера: {e}")
+        address = self.server_address_input.text().strip()
+
+        # Конфиг уже прочитан в load_data, повторно файл не открываем
+        self._config["host"] = address
+        self._pending_config["host"] = address
+        self._config_edits["host"] = address
+        self._save_timer.start()
+
+    def persist_config(self, wait=False):
+        """Запись отложенных изменений конфига на диск в отдельном потоке.
+        С wait=True дожидается окончания записи (используется при выходе из приложения)."""
+        self._save_timer.stop()
+        if not self._pending_config:
+            return
+        updates, self._pending_config = self._pending_config, {}
+
+        # Изменения накладываются на файл с диска, а не на self._config: если начальное чтение
+        # ещё не завершилось или не удалось, остальные ключи конфига не будут потеряны
+        future = _config_writer.submit(_update_settings_json, updates)
+        future.add_done_callback(lambda f: self.config_saved.emit(f.exception()))
+        if wait:
+            future.exception()
+
+    def _on_config_saved(self, error):
+        if error is None:
+            self.api_client.reload_host()
+            self.update_status(f"✅ Адрес {self._config.get('host', '')} был сохранен в конфиг!")
+        else:
+            self.update_status(f"❌ Ошибка сохранения адреса сервера: {error}")
 
     def test_server_address(self):
         """Проверка адреса сервера"""
@@ -252,50 +372,42 @@ class SettingsWindow(QWidget):
             self.update_status("❌ Введите адрес сервера для проверки")
             return
 
-        import re
-        url_pattern = re.compile(
-            r'^https?://'  # http:// или https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # домен
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
-            r'(?::\d+)?'  # порт
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-
-        if url_pattern.match(server_address):
+        if self._is_valid_server_address(server_address):
             self.test_server_connection(server_address)
         else:
             self.update_status("❌ Неверный формат адреса сервера")
 
+    @staticmethod
+    def _is_valid_server_address(address):
+        """Адрес должен быть http(s)-URL с хостом (домен, localhost или IP) и, если указан, числовым портом"""
+        try:
+            parts = urlsplit(address)
+            parts.port  # ValueError при некорректном порте
+        except ValueError:
+            return False
+        return parts.scheme in ("http", "https") and bool(parts.hostname) and not any(c.isspace() for c in address)
+
     def test_server_connection(self, server_address):
         """Проверка соединения с сервером"""
-
-        def check_connection(status):
-            if status is True:
-                self.update_status(f"✅ Сервер {server_address} доступен!")
-            else:
-                self.update_status(f"❌ Сервер {server_address} недоступен!")
-
-        def errors_handler(error):
-            print(error)
-
         self.async_runner = AsyncRunner()
-        self.async_runner.result.connect(check_connection)
-        self.async_runner.error.connect(errors_handler)
+        self.async_runner.result.connect(partial(self._on_server_checked, server_address))
+        self.async_runner.error.connect(self._on_server_check_error)
         self.async_runner.run_async(self.api_client.check_server_health, host_for_check=server_address)
 
-    def on_backup_item_clicked(self, item):
-        """Обработчик клика по элементу списка"""
-        if item and item.data(Qt.UserRole):
-            item_data = item.data(Qt.UserRole)
+    def _on_server_checked(self, server_address, status):
+        if status is True:
+            self.update_status(f"✅ Сервер {server_address} доступен!")
+        else:
+            self.update_status(f"❌ Сервер {server_address} недоступен!")
 
-            if item_data.get("type") == "game_header":
-                game_name = item_data["game"]
-                if game_name in self.expanded_games:
-                    self.expanded_games.remove(game_name)
-                else:
-                    self.expanded_games.add(game_name)
+    def _on_server_check_error(self, error):
+        self.update_status(f"❌ Ошибка проверки сервера: {error['exception']}")
 
-                self.load_data()
+    def on_backup_item_clicked(self, index):
+        """Обработчик клика по элементу списка"""
+        tag = index.data(Qt.UserRole)
+        if tag is not None and tag.kind == HEADER_ITEM:
+            self.backups_model.toggle_game(index.row())
 
     def save_token(self):
         """Сохранение токена"""
@@ -308,128 +420,101 @@ class SettingsWindow(QWidget):
 
     def test_token(self):
         """Проверка токена"""
-
-        def handle_signal(status):
-            if status is True:
-                self.update_status("✅ Токен действителен")
-            else:
-                self.update_status("❌ Токен НЕ действителен или не верный!")
-
         token = self.token_input.text().strip()
 
         if token:
             self.async_runner = AsyncRunner()
-            self.async_runner.finished.connect(handle_signal)
-            self.async_runner.error.connect(handle_signal)
+            self.async_runner.finished.connect(self._on_token_checked)
+            self.async_runner.error.connect(self._on_token_checked)
             self.async_runner.run_async(self.api_client.test_token)
         else:
             self.update_status("❌ Введите токен для проверки")
 
-    def refresh_backups(self, backups_data):
-        """Обновление списка бэкапов с возможностью сворачивания"""
-        self.backups_list.clear()
-
-        for game_name, backups in backups_data.items():
-            is_expanded = game_name in self.expanded_games
-
-            if is_expanded:
-                game_text = f"📂 {game_name} ({len(backups)} бэкапов)"
-            else:
-                game_text = f"📁 {game_name} ({len(backups)} бэкапов)"
-
-            game_item = QListWidgetItem(game_text)
-            game_item.setData(Qt.UserRole, {"type": "game_header", "game": game_name})
-            game_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-            game_item.setBackground(Qt.darkGray)
-            game_item.setForeground(Qt.white)
-            self.backups_list.addItem(game_item)
-
-            def format_bytes(size_bytes):
-                """Преобразует размер в байтах в человеко-читаемый формат"""
-                if size_bytes < 1024:
-                    return f"{size_bytes} Б"
-                elif size_bytes < 1024 ** 2:
-                    return f"{size_bytes / 1024:.2f} КБ"
-                elif size_bytes < 1024 ** 3:
-                    return f"{size_bytes / (1024 ** 2):.2f} МБ"
-                else:
-                    return f"{size_bytes / (1024 ** 3):.2f} ГБ"
-
-            if is_expanded:
-                for backup in backups:
-                    filename = backup["filename"]
-                    size_bytes = backup["size_bytes"]
-                    size_str = format_bytes(size_bytes)
-                    backup_item = QListWidgetItem(f"   📄 {filename} ({size_str})")
-                    backup_item.setData(Qt.UserRole, {"type": "backup", "game": game_name, "backup": backup})
-                    backup_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-                    self.backups_list.addItem(backup_item)
+    def _on_token_checked(self, status):
+        if status is True:
+            self.update_status("✅ Токен действителен")
+        else:
+            self.update_status("❌ Токен НЕ действителен или не верный!")
 
+    def _on_backups_loaded(self, backups_data):
+        """Данные о бэкапах получены с сервера"""
+        self.backups_model.set_backups(backups_data)
         self.update_status("Данные загружены")
 
     def restore_backup(self):
         """Восстановление выбранного бэкапа"""
-
-        def restoring_in_progress():
-            self.update_status(f"🔄 Восстановление бэкапа {backup_name['filename']} для {game_name}")
-
-        def restoring_is_done(status):
-            if status == 200:
-                self.update_status(f"✅ Бэкап {backup_name['filename']} для {game_name} успешно востановлен!")
-            else:
-                self.update_status("❌ Не удалось восстановить бэкап!")
-
-        def restoring_error(error):
-            self.update_status(f"❌ Не удалось восстановить бэкап! Ошибка: {error}")
-
-        current_item = self.backups_list.currentItem()
-        if current_item and current_item.data(Qt.UserRole):
-            backup_info = current_item.data(Qt.UserRole)
-            game_name = backup_info["game"]
-            backup_name = backup_info["backup"]
+        tag = self.backups_list.currentIndex().data(Qt.UserRole)
+        if tag and tag.kind == BACKUP_ITEM:
+            game_name = tag.game
+            filename = tag.backup["filename"]
 
             async_runner = AsyncRunner()
-            async_runner.progress.connect(restoring_in_progress)
-            async_runner.result.connect(restoring_is_done)
-            async_runner.error.connect(restoring_error)
-            async_runner.run_async(restore_backup_action, game_name, backup_name["filename"], self.api_client)
+            self._restore_runners.add(async_runner)
+            async_runner.progress.connect(partial(self._on_restore_progress, game_name, filename))
+            async_runner.result.connect(partial(self._on_restore_done, async_runner, game_name, filename))
+            async_runner.error.connect(partial(self._on_restore_error, async_runner))
+            async_runner.run_async(restore_backup_action, game_name, filename, self.api_client)
         else:
             self.update_status("❌ Выберите бэкап для восстановления")
 
-    def delete_backup(self):
-        """Удаление выбранного бэкапа"""
+    def _on_restore_progress(self, game_name, filename, _message):
+        self.update_status(f"🔄 Восстановление бэкапа {filename} для {game_name}")
 
-        def backup_deleted(status):
-            if status == 200:
-                self.update_status(f"🗑️ Бэкап {backup_name['filename']} для {game_name} был успешно удалён!")
-            elif status == 204:
-                self.update_status(
-                    f"❌ Невозможно удалить бэкап {backup_name['filename']} для {game_name}! Файл отсутствует на сервере!")
-            else:
-                self.update_status(f"❌ Ошибка удаления бэкапа {backup_name['filename']} для {game_name}! Код ответа от сервера: {status}")
-            self.load_data()
-
-        def backup_delete_error(error):
-            self.update_status(
-                f"❌ Ошибка удаления бэкапа {backup_name['filename']} для {game_name}! Текст ошибки: {error}")
-            self.load_data()
+    def _on_restore_done(self, runner, game_name, filename, status):
+        self._restore_runners.discard(runner)
+        if status == 200:
+            self.update_status(f"✅ Бэкап {filename} для {game_name} успешно востановлен!")
+        else:
+            self.update_status("❌ Не удалось восстановить бэкап!")
 
-        current_item = self.backups_list.currentItem()
-        if current_item and current_item.data(Qt.UserRole):
-            backup_info = current_item.data(Qt.UserRole)
-            game_name = backup_info["game"]
-            backup_name = backup_info["backup"]
+    def _on_restore_error(self, runner, error):
+        self._restore_runners.discard(runner)
+        self.update_status(f"❌ Не удалось восстановить бэкап! Ошибка: {error}")
+
+    def delete_backup(self):
+        """Удаление выбранного бэкапа"""
+        tag = self.backups_list.currentIndex().data(Qt.UserRole)
+        if tag and tag.kind == BACKUP_ITEM:
+            game_name = tag.game
+            filename = tag.backup["filename"]
 
             self.async_runner = AsyncRunner()
-            self.async_runner.result.connect(backup_deleted)
-            self.async_runner.error.connect(backup_delete_error)
-            self.async_runner.run_async(delete_backup_action, game_name, backup_name['filename'], self.api_client)
+            self.async_runner.result.connect(partial(self._on_backup_deleted, game_name, filename))
+            self.async_runner.error.connect(partial(self._on_backup_delete_error, game_name, filename))
+            self.async_runner.run_async(delete_backup_action, game_name, filename, self.api_client)
         else:
             self.update_status("❌ Выберите бэкап для удаления")
 
+    def _on_backup_deleted(self, game_name, filename, status):
+        if status == 200:
+            self.update_status(f"🗑️ Бэкап {filename} для {game_name} был успешно удалён!")
+        elif status == 204:
+            self.update_status(
+                f"❌ Невозможно удалить бэкап {filename} для {game_name}! Файл отсутствует на сервере!")
+        else:
+            self.update_status(f"❌ Ошибка удаления бэкапа {filename} для {game_name}! Код ответа от сервера: {status}")
+        self.load_data()
+
+    def _on_backup_delete_error(self, game_name, filename, error):
+        self.update_status(
+            f"❌ Ошибка удаления бэкапа {filename} для {game_name}! Текст ошибки: {error}")
+        self.load_data()
+
     def update_status(self, message):
         """Обновление статуса"""
-        self.status_text.append(message)
+        self._pending_status.append(message)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """Вывод накопленных сообщений статуса"""
+        if not self._pending_status:
+            return
+
+        messages = "\n".join(self._pending_status)
+        self._pending_status.clear()
+
+        self.status_text.append(messages)
         self.status_text.verticalScrollBar().setValue(
             self.status_text.verticalScrollBar().maximum()
-        )
\ No newline at end of file
+        )
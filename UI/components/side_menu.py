@@ -9,18 +9,14 @@ from _version import __version__
 class SettingsWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background-color: #29292A;")
+        self.setObjectName("SettingsWidget")
         self.setup_widget()
 
     def setup_widget(self):
         layout = QVBoxLayout()
 
         title = QLabel("Настройки")
-        title.setStyleSheet("""
-            color: white;
-            font-size: 24px;
-            font-weight: bold;
-        """)
+        title.setObjectName("SettingsWidgetTitle")
 
         layout.addWidget(title)
         layout.addStretch()
@@ -35,16 +31,12 @@ class SideMenu(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("SideMenu")
         self.create_side_menu()
 
     def create_side_menu(self):
         logo_label = QLabel(f"Mnemy\nver {__version__}")
-        logo_label.setStyleSheet("""
-                            color: white;
-                            font-size: 16px;
-                            font-weight: bold;
-                            text-align: center;
-                        """)
+        logo_label.setObjectName("SideMenuLogo")
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Кнопки меню
@@ -52,25 +44,7 @@ class SideMenu(QWidget):
         menu_btn_settings = QPushButton("Настройки")
         menu_btn_about = QPushButton("О программе")
 
-        button_style = """
-                            QPushButton {
-                                background-color: transparent;
-                                border: none;
-                                color: white;
-                                padding: 12px;
-                                text-align: left;
-                                font-size: 16px;
-                            }
-                            QPushButton:hover {
-                                background-color: rgba(27, 60, 191, 0.2);
-                                border-radius: 8px;
-                            }
-                        """
-
-        menu_btn_games.setStyleSheet(button_style)
-        menu_btn_settings.setStyleSheet(button_style)
-        menu_btn_about.setStyleSheet(button_style)
-
+        # Оформление кнопок задаётся в UI/resources/app.qss (#SideMenu QPushButton)
         menu_btn_settings.clicked.connect(self.settings_clicked.emit)
         menu_btn_games.clicked.connect(self.games_clicked.emit)
         menu_btn_about.clicked.connect(self.about_clicked.emit)
@@ -1,10 +1,13 @@
 # Copyright (C) 2025 IAMVanilka
 # SPDX-License-Identifier: GPL-3.0-or-later
 import logging
+import os
+from functools import cache
 
 from PySide6.QtCore import QSettings
 from PySide6.QtGui import QIcon, QAction
-from PySide6.QtWidgets import QHBoxLayout, QFrame, QWidget, QStackedWidget, QSystemTrayIcon, QMenu, QApplication
+from PySide6.QtWidgets import (QHBoxLayout, QFrame, QWidget, QStackedWidget, QSystemTrayIcon, QMenu, QApplication,
+                               QStyle)
 
 from UI.components.side_menu import SideMenu
 from UI.components.settings_window import SettingsWindow
@@ -17,33 +20,38 @@ from modules.API_client import APIClient
 
 logger = logging.getLogger(__name__)
 
+ICON_PATH = "UI/resources/icon.ico"
+
+@cache
+def app_icon() -> QIcon:
+    """Иконка приложения: файл проверяется и загружается один раз, дальше отдаётся готовый QIcon"""
+    if os.path.exists(ICON_PATH):
+        return QIcon(ICON_PATH)
+    return QApplication.style().standardIcon(QStyle.SP_ComputerIcon)
+
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
-        self.api_client = APIClient()
+        self.setObjectName("MainWindow")
+        self.api_client = APIClient.instance()
         self.settings = QSettings("Mnemy")
         self.tray_icon = None
-        self.setWindowIcon(QIcon('UI/resources/icon.ico'))
+        self.setWindowIcon(app_icon())
         self.main_layout = None
         self.stacked_widget = None
+        self.settings_widget = None
         self.loading_dialog = LoadingWindow()
         self.setup_tray_icon()
         self.get_games_data()
 
     def setup_tray_icon(self):
         """Настройка иконки в системном трее"""
-        import os
-
         if not QSystemTrayIcon.isSystemTrayAvailable():
             logger.error("Системный трей недоступен")
             return
 
         self.tray_icon = QSystemTrayIcon(self)
-        icon_path = "UI/resources/icon.ico"
-        if os.path.exists(icon_path):
-            self.tray_icon.setIcon(QIcon(icon_path))
-        else:
-            self.tray_icon.setIcon(self.style().standardIcon(self.style().SP_ComputerIcon))
+        self.tray_icon.setIcon(app_icon())
 
         tray_menu = QMenu()
 
@@ -82,11 +90,18 @@ class MainWindow(QWidget):
 
     def quit_application(self):
         """Закрыть приложение"""
+        self.flush_settings()
+
         # Убираем иконку из трея перед выходом
         if self.tray_icon:
             self.tray_icon.hide()
         QApplication.quit()
 
+    def flush_settings(self):
+        """Сохранить отложенные изменения настроек перед выходом"""
+        if self.settings_widget is not None:
+            self.settings_widget.persist_config(wait=True)
+
     def minimize_to_tray(self):
         """Свернуть в трей программно"""
         if self.tray_icon and self.tray_icon.isVisible():
@@ -130,7 +145,6 @@ class MainWindow(QWidget):
 
     def initializeUI(self):
         self.setWindowTitle('Mnemy')
-        self.setStyleSheet("background-color: #222222;")
         self.setGeometry(600, 600, 1200, 600)
         self.load_window_state()
         self.createWindow()
@@ -149,10 +163,9 @@ class MainWindow(QWidget):
 
         self.stacked_widget = QStackedWidget()
         self.games_dashboard = GamesDashboard(self)
-        self.settings_widget = SettingsWindow(self)
 
+        # Вкладка настроек создаётся при первом открытии (см. show_settings)
         self.stacked_widget.addWidget(self.games_dashboard)  # Index 0
-        self.stacked_widget.addWidget(self.settings_widget)  # Index 1
 
         menu_widget.games_clicked.connect(self.show_games)
         menu_widget.settings_clicked.connect(self.show_settings)
@@ -169,7 +182,10 @@ class MainWindow(QWidget):
         self.stacked_widget.setCurrentIndex(0)
 
     def show_settings(self):
-        self.stacked_widget.setCurrentIndex(1)
+        if self.settings_widget is None:
+            self.settings_widget = SettingsWindow(self, api_client=self.api_client)
+            self.stacked_widget.addWidget(self.settings_widget)  # Index 1
+        self.stacked_widget.setCurrentWidget(self.settings_widget)
 
     def show_about(self):
         print("Показать 'О программе'")
@@ -183,12 +199,17 @@ class MainWindow(QWidget):
         )
 
     def save_window_state(self):
-        self.settings.setValue("window_size", self.size())
-        self.settings.setValue("window_position", self.pos())
+        self.settings.beginGroup("window")
+        self.settings.setValue("size", self.size())
+        self.settings.setValue("position", self.pos())
+        self.settings.endGroup()
+        self.settings.sync()
 
     def load_window_state(self):
-        size = self.settings.value("window_size", self.size())
-        pos = self.settings.value("window_position", self.pos())
+        self.settings.beginGroup("window")
+        size = self.settings.value("size", self.size())
+        pos = self.settings.value("position", self.pos())
+        self.settings.endGroup()
 
         self.resize(size)
         self.move(pos)
@@ -204,4 +225,5 @@ class MainWindow(QWidget):
             event.ignore()
         else:
             self.save_window_state()
+            self.flush_settings()
             event.accept()
\ No newline at end of file
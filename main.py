@@ -14,17 +14,28 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from pathlib import Path
+
 from PySide6.QtWidgets import QApplication
 
 from UI.ui import MainWindow
 from modules.processes_watcher import ProcessWatcher
 from modules.logger_config import setup_logging
+from modules.ui_controllers.async_runner import stop_async_loop
+from modules.API_client import APIClient
 
 import sys
 
+STYLESHEET_PATH = Path("UI/resources/app.qss")
+
 if __name__ == "__main__":
     setup_logging()
     app = QApplication(sys.argv)
+    # Единая таблица стилей: разбирается один раз на всё приложение
+    if STYLESHEET_PATH.exists():
+        app.setStyleSheet(STYLESHEET_PATH.read_text(encoding="utf-8"))
+    # При выходе закрываем HTTP-сессию общего цикла и останавливаем его
+    app.aboutToQuit.connect(lambda: stop_async_loop(APIClient.instance().aclose))
     window = MainWindow()
     process_watcher = ProcessWatcher(main_window=window)
     process_watcher.run()
@@ -1,11 +1,18 @@
-import os
+import asyncio
+import itertools
 import json
-import shutil
+import os
+import threading
+import time
+import weakref
 
+import aiofiles
 import aiohttp
 import keyring
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests.exceptions import HTTPError
 
 from datetime import datetime
@@ -13,69 +20,185 @@ from typing import List, Dict, Any, Optional
 
 from aiohttp.abc import HTTPException
 
+from modules.file_manager import hash_generator, create_archive_chunk_generator, get_archive_chunks
+
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+UPLOAD_CHUNK_SIZE = 1 << 20
+IMAGE_CHUNK_SIZE = 64 << 10
+HEALTH_CACHE_TTL = 2.0
+STEAM_COVER_URL = "https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/header.jpg"
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode()
+
+    def _dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
 class APIClient:
+    _instance = None
+    _instance_lock = threading.Lock()
+
     def __init__(self, app_name="Mnemy", config_file="settings.json"):
         self.app_name = app_name
         self.token_name = "x_api_token"
         self.config_file = config_file
+        self._token: Optional[str] = None
+        self._host_mtime: Optional[int] = None
+        # Gateway errors are retried; connect and read failures surface at once
+        self._session = self._create_session(Retry(
+            total=3, connect=0, read=0, status=3, backoff_factor=0.3,
+            status_forcelist=[502, 503, 504], raise_on_status=False
+        ))
+        # Health probes must fail fast, so their session never retries
+        self._probe_session = self._create_session(0, pool_maxsize=2)
+        # aiohttp session is bound to an event loop, so keep one per loop
+        self._aio_sessions = weakref.WeakKeyDictionary()
+        self._config: Dict[str, Any] = {}
+        self.host = ""
+        self.reload_host()
+        self._steam_cache_file = "steam_covers.json"
+        self._steam_app_ids: Dict[str, int] = self._load_steam_cache()
+        self._steam_cache_dirty = False
+        self._last_health: Optional[tuple[str, float]] = None
+
+    @classmethod
+    def instance(cls) -> "APIClient":
+        """Return the client shared across the whole app."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @staticmethod
+    def _create_session(max_retries, pool_maxsize: int = 16) -> requests.Session:
+        """Create a keep-alive HTTP session with the given retry policy."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=max_retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    async def _aio(self) -> aiohttp.ClientSession:
+        """Return the keep-alive aiohttp session of the running event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._aio_sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=30, ttl_dns_cache=300)
+            # No overall deadline by default: uploads and downloads of big saves may take long
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=10)
+            session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self._aio_sessions[loop] = session
+        return session
+
+    async def aclose(self):
+        """Close the aiohttp session of the running event loop."""
+        session = self._aio_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _config_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def reload_host(self):
+        """Re-read config file and take the server host from it."""
+        self._host_mtime = self._config_mtime()
+        self._config = self._read_config()
         self.host = self.load_host()
 
-    def load_host(self) -> bool:
-        """Load server host from JSON config file."""
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    return config.get("host", "")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to load server host from {self.config_file}: {e}", exc_info=True)
-            return False
+    def _refresh_host(self):
+        """Reload host only if config file changed since the last read."""
+        if self._config_mtime() != self._host_mtime:
+            self.reload_host()
 
-    def set_host(self, host: str) -> bool:
-        """Save server host to config file."""
+    def _read_config(self) -> Dict[str, Any]:
+        """Read JSON config file."""
         try:
-            config = {}
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    return _loads(f.read())
+            return {}
+        except Exception as e:
+            logger.error(f"Failed to load config from {self.config_file}: {e}", exc_info=True)
+            return {}
 
-            config["host"] = host
+    def load_host(self) -> str:
+        """Return server host from the loaded config."""
+        return self._config.get("host", "")
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+    def _load_steam_cache(self) -> Dict[str, int]:
+        """Load cached {game_name: steam_app_id} mapping."""
+        try:
+            if os.path.exists(self._steam_cache_file):
+                with open(self._steam_cache_file, 'rb') as f:
+                    return _loads(f.read())
+        except Exception as e:
+            logger.error(f"Failed to load Steam cache from {self._steam_cache_file}: {e}", exc_info=True)
+        return {}
 
-            self.host = host
-            logger.info(f"Server host updated to: {host}")
-            return True
+    def _save_steam_cache(self):
+        """Persist Steam app ids found during this run."""
+        try:
+            tmp_path = f"{self._steam_cache_file}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps_pretty(self._steam_app_ids))
+            os.replace(tmp_path, self._steam_cache_file)
+            self._steam_cache_dirty = False
         except Exception as e:
-            logger.error(f"Failed to save server host to {self.config_file}: {e}", exc_info=True)
-            return False
+            logger.error(f"Failed to save Steam cache to {self._steam_cache_file}: {e}", exc_info=True)
 
     def save_token(self, token: str):
         """Save API token securely."""
         try:
             keyring.set_password(self.app_name, self.token_name, token)
+            self._token = token
             logger.debug("API token saved securely")
         except Exception as e:
             logger.error(f"Failed to save API token: {e}", exc_info=True)
             raise
 
     def get_token(self) -> Optional[str]:
-        """Retrieve API token."""
+        """Retrieve API token (cached after the first keyring lookup)."""
+        if self._token:
+            return self._token
         try:
             token = keyring.get_password(self.app_name, self.token_name)
             if not token:
                 logger.debug("No API token found in keyring")
+            self._token = token
             return token
         except Exception as e:
             logger.error(f"Error retrieving API token: {e}", exc_info=True)
             return None
 
+    def _reload_token(self, rejected_token: str) -> bool:
+        """Drop the cached token and re-read it from keyring. Return True if a different token was found."""
+        self._token = None
+        token = self.get_token()
+        return bool(token) and token != rejected_token
+
     def clear_token(self):
         """Remove stored API token."""
+        self._token = None
         try:
             keyring.delete_password(self.app_name, self.token_name)
             logger.info("API token cleared from keyring")
@@ -84,9 +207,9 @@ class APIClient:
         except Exception as e:
             logger.error(f"Error clearing API token: {e}", exc_info=True)
 
-    def _make_request(self, endpoint: str, method: str, **kwargs):
-        """Make an authenticated HTTP request."""
-        self.host = self.load_host()
+    def _api_target(self, endpoint: str) -> tuple[str, Dict[str, str]]:
+        """Build URL and auth headers for an API endpoint."""
+        self._refresh_host()
 
         if not self.host:
             logger.error("Can't make request: Server host is not configured")
@@ -97,24 +220,33 @@ class APIClient:
             logger.error("Can't make request: API token is missing!")
             raise ValueError("API token not found")
 
-        url = f"{self.host}{endpoint}"
+        return f"{self.host}{endpoint}", {'x-api-token': token}
+
+    def _make_request(self, endpoint: str, method: str, **kwargs):
+        """Make an authenticated HTTP request."""
+        url, auth_headers = self._api_target(endpoint)
         headers = kwargs.get('headers', {})
-        headers['x-api-token'] = token
+        headers.update(auth_headers)
         kwargs['headers'] = headers
 
         try:
             method = method.upper()
-            response = requests.request(method, url, **kwargs)
+            response = self._session.request(method, url, **kwargs)
+            if response.status_code == 401 and self._reload_token(auth_headers['x-api-token']):
+                headers['x-api-token'] = self._token
+                response = self._session.request(method, url, **kwargs)
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
             raise
 
+    async def _request(self, endpoint: str, method: str, **kwargs):
+        """Run _make_request in a worker thread so the event loop keeps running."""
+        return await asyncio.to_thread(self._make_request, endpoint, method, **kwargs)
+
     async def check_files(self, base_dir: str, game_name: str, date: datetime):
         """Check which files need to be uploaded."""
         try:
-            from modules.file_manager import hash_generator
-
             if not os.path.isdir(base_dir):
                 logger.error(f"Base directory does not exist or is not a folder: {base_dir}")
                 return []
@@ -126,10 +258,11 @@ class APIClient:
                 "last_sync_date": date.isoformat() if date else None
             }
 
-            response = self._make_request(
+            response = await self._request(
                 '/files/check_files',
                 method="post",
-                data=json.dumps(data),
+                data=_dumps(data),
+                headers=dict(JSON_HEADERS),
                 allow_redirects=False
             )
 
@@ -137,10 +270,10 @@ class APIClient:
                 logger.info("Received redirect (307) from /files/check_files")
                 return response.status_code
 
-            response_data = response.json()
+            response_data = _loads(response.content)
             missing = response_data['files_data']['missing_on_server']
             mismatched = response_data['files_data']['mismatched_hashes']
-            files_to_upload = [os.path.join(base_dir, f.lstrip('/\\')) for f in missing + mismatched]
+            files_to_upload = [os.path.join(base_dir, f.lstrip('/\\')) for f in itertools.chain(missing, mismatched)]
             logger.info(f"Found {len(files_to_upload)} files to upload for game '{game_name}'")
             return files_to_upload
 
@@ -155,67 +288,59 @@ class APIClient:
             return None
 
         try:
-            from modules.file_manager import create_archive_chunk_generator
             if files_paths is None:
                 return 200
-            chunk_generator = create_archive_chunk_generator(base_dir, files_paths)
-
-            async def data_stream():
-                async for chunk in chunk_generator:
-                    yield chunk
+            chunk_generator = create_archive_chunk_generator(base_dir, files_paths, chunk_size=UPLOAD_CHUNK_SIZE)
 
             data = aiohttp.FormData()
-            data.add_field("file", data_stream(), filename="files.tar.gz", content_type="application/gzip")
+            data.add_field("file", chunk_generator, filename="files.tar.gz", content_type="application/gzip")
             data.add_field("game_name", game_name)
 
-            async with aiohttp.ClientSession() as session:
-                logger.info(f"📤 Streaming archive for game '{game_name}' to server...")
-                api_token = self.get_token()
-                if not api_token:
-                    logger.error("Cannot upload: API token missing")
-                    return None
-
-                async with session.post(
-                    f"{self.host}/files/upload_data",
-                    data=data,
-                    headers={"x-api-token": api_token}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info(f"✅ Upload successful for game '{game_name}': {result}")
-                        return response.status
-                    else:
-                        text = await response.text()
-                        logger.error(f"❌ Upload failed for game '{game_name}': {response.status} {text}")
-                        return response.status
+            session = await self._aio()
+            logger.info(f"📤 Streaming archive for game '{game_name}' to server...")
+            api_token = self.get_token()
+            if not api_token:
+                logger.error("Cannot upload: API token missing")
+                return None
+            self._refresh_host()
+
+            async with session.post(
+                f"{self.host}/files/upload_data",
+                data=data,
+                headers={"x-api-token": api_token}
+            ) as response:
+                if response.status == 200:
+                    result = await response.json(loads=_loads)
+                    logger.info(f"✅ Upload successful for game '{game_name}': {result}")
+                    return response.status
+                else:
+                    text = await response.text()
+                    logger.error(f"❌ Upload failed for game '{game_name}': {response.status} {text}")
+                    return response.status
 
         except Exception as e:
             logger.error(f"Unexpected error during upload for game '{game_name}': {e}", exc_info=True)
             return None
 
-    async def download_files(self, game_name: str, path_to_saves: str, delete_saves_folder: bool) -> int|None:
+    async def download_files(self, game_name: str, path_to_saves: str) -> int|None:
         """Download game saves from server."""
         try:
             os.makedirs(path_to_saves, exist_ok=True)
 
-            from modules.file_manager import get_archive_chunks
-
-            with self._make_request(
-                "/files/download_data",
-                method="get",
-                params={'game_name': game_name},
-                stream=True
-            ) as response:
-                if delete_saves_folder:
-                    shutil.rmtree(path_to_saves)
-                    os.mkdir(path_to_saves)
-                await get_archive_chunks(response, path_to_saves)
+            url, headers = self._api_target("/files/download_data")
+            session = await self._aio()
+            # Archives can take a while: only limit the idle time between chunks
+            timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+            async with session.get(url, headers=headers, params={'game_name': game_name}, timeout=timeout) as response:
+                response.raise_for_status()
+                # The extracted archive replaces the saves folder as a whole, so there is nothing to wipe beforehand
+                await get_archive_chunks(response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE), path_to_saves)
 
             logger.info(f"Game saves for '{game_name}' downloaded successfully to {path_to_saves}")
             return 200
 
-        except requests.exceptions.HTTPError as e:
-            if "404" in str(e):
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
                 logger.error(f"Can't download saves for game '{game_name}'. Saves doesn't exist on server!.")
                 return 404
             else:
@@ -229,7 +354,7 @@ class APIClient:
         """Delete game data on server."""
         try:
             params = {"delete_backups": delete_backups} if delete_backups else None
-            response = self._make_request(
+            response = await self._request(
                 f'/manage/delete/game/{game_name}',
                 method="delete",
                 params=params
@@ -238,7 +363,8 @@ class APIClient:
                 logger.info(f"Game '{game_name}' doesn't exist on server")
                 return response.status_code
             logger.info(f"Game '{game_name}' deleted successfully (backups deleted: {delete_backups})")
-            logger.debug(f"Server response: {response.json()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Server response: {response.text}")
             return response.status_code
         except Exception as e:
             logger.error(f"Failed to delete game '{game_name}' on server: {e}", exc_info=True)
@@ -249,13 +375,14 @@ class APIClient:
         try:
             if game_name == new_game_name:
                 return 200
-            response = self._make_request(
+            response = await self._request(
                 f'/manage/update_game/{game_name}',
                 method="patch",
                 params={"new_game_name": new_game_name}
             )
             logger.info(f"Game metadata updated: '{game_name}' → '{new_game_name}'")
-            logger.debug(f"Server response: {response.json()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Server response: {response.text}")
             return response.status_code
         except Exception as e:
             logger.error(f"Failed to update game '{game_name}': {e}", exc_info=True)
@@ -264,16 +391,16 @@ class APIClient:
     async def get_games_data(self) -> List[Dict[str, Any]]:
         """Fetch list of games from server."""
         try:
-            response = self._make_request('/manage/get_games_data', method='get', timeout=30)
+            response = await self._request('/manage/get_games_data', method='get', timeout=30)
             response.raise_for_status()
-            logger.debug(f"Server response: {response.json()}")
 
             content_type = response.headers.get('content-type', '')
             if not content_type.startswith('application/json'):
                 logger.error(f"Unexpected content type: {content_type}")
                 raise ValueError("Server returned non-JSON response")
 
-            data = response.json()
+            data = _loads(response.content)
+            logger.debug(f"Server response: {data}")
             games = data.get("games_list", [])
             logger.info(f"Retrieved {len(games)} games from server")
             return games
@@ -295,50 +422,97 @@ class APIClient:
             raise Exception(f"Unknown error: {e}")
 
     async def get_games_images(self, games_list: list, steam: bool = False):
-        """Download game cover images."""
+        """Download game cover images concurrently."""
+        os.makedirs("UI/resources", exist_ok=True)
+        semaphore = asyncio.Semaphore(8)
+
+        # One directory listing instead of a stat() per game
+        with os.scandir("UI/resources") as entries:
+            existing_images = {entry.name for entry in entries if entry.is_file()}
+
+        tasks = []
         for game_name in games_list:
-            image_path = f"UI/resources/{game_name}.jpg"
-            if os.path.exists(image_path):
+            if f"{game_name}.jpg" in existing_images:
                 logger.debug(f"Image already exists for game '{game_name}', skipping")
                 continue
+            image_path = f"UI/resources/{game_name}.jpg"
+            tasks.append(self._fetch_one_image(game_name, image_path, steam, semaphore))
+
+        await asyncio.gather(*tasks, return_exceptions=True)
 
+        if self._steam_cache_dirty:
+            await asyncio.to_thread(self._save_steam_cache)
+
+    async def _http_get_bytes(self, url: str, headers: Optional[Dict[str, str]] = None,
+                              params: Optional[Dict[str, str]] = None, timeout: float = 30) -> bytes:
+        """GET a URL through the shared aiohttp session and return the body."""
+        session = await self._aio()
+        async with session.get(url, headers=headers, params=params,
+                               timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def _http_download(self, url: str, path: str, headers: Optional[Dict[str, str]] = None,
+                             timeout: float = 30):
+        """Stream a GET response body into a file in fixed-size chunks.
+
+        The body goes to a temporary file that replaces `path` only once fully written,
+        so a dropped connection never leaves a truncated cover behind.
+        """
+        session = await self._aio()
+        tmp_path = path + ".part"
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response.raise_for_status()
+            try:
+                async with aiofiles.open(tmp_path, "wb") as file:
+                    async for chunk in response.content.iter_chunked(IMAGE_CHUNK_SIZE):
+                        await file.write(chunk)
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+    async def _fetch_one_image(self, game_name: str, image_path: str, steam: bool, semaphore: asyncio.Semaphore):
+        """Download a single cover image and write it to disk."""
+        async with semaphore:
             try:
                 if steam:
-                    image_url = self._get_steam_cover_url(game_name)
+                    image_url = await self._get_steam_cover_url(game_name)
                     if not image_url:
                         logger.warning(f"No Steam cover found for game '{game_name}'")
-                        continue
-                    response = requests.get(image_url, timeout=30)
-                else:
-                    response = self._make_request(
-                        f'/files/get_image/{game_name}',
-                        method="get",
-                        timeout=30
-                    )
-
-                if response.status_code == 200:
-                    os.makedirs("UI/resources", exist_ok=True)
-                    with open(image_path, "wb") as image_file:
-                        image_file.write(response.content)
-                    logger.info(f"Cover image saved for game '{game_name}'")
+                        return
+                    headers = None
                 else:
-                    logger.warning(f"Image download failed for '{game_name}': HTTP {response.status_code}")
+                    image_url, headers = self._api_target(f'/files/get_image/{game_name}')
 
+                await self._http_download(image_url, image_path, headers=headers)
+                logger.info(f"Cover image saved for game '{game_name}'")
+
+            except aiohttp.ClientResponseError as e:
+                logger.warning(f"Image download failed for '{game_name}': HTTP {e.status}")
             except Exception as e:
                 logger.error(f"Error downloading image for game '{game_name}': {e}", exc_info=True)
 
-    def _get_steam_cover_url(self, game_name: str) -> Optional[str]:
+    async def _get_steam_cover_url(self, game_name: str) -> Optional[str]:
         """Fetch Steam cover image URL."""
-        search_url = f"https://store.steampowered.com/api/storesearch/?term={game_name}&l=english&cc=US"
+        app_id = self._steam_app_ids.get(game_name)
+        if app_id is not None:
+            return STEAM_COVER_URL.format(app_id=app_id)
+
+        search_url = "https://store.steampowered.com/api/storesearch/"
         try:
-            response = requests.get(search_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            body = await self._http_get_bytes(search_url, params={'term': game_name, 'l': 'english', 'cc': 'US'},
+                                              timeout=10)
+            data = _loads(body)
 
             if data.get('items'):
                 app_id = data['items'][0]['id']
-                cover_url = f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/header.jpg"
-                return cover_url
+                self._steam_app_ids[game_name] = app_id
+                self._steam_cache_dirty = True
+                return STEAM_COVER_URL.format(app_id=app_id)
             return None
         except Exception as e:
             logger.error(f"Steam API error for game '{game_name}': {e}", exc_info=True)
@@ -347,10 +521,10 @@ class APIClient:
     async def get_backups_data(self) -> Dict[str, Any]:
         """Get backup metadata from server."""
         try:
-            response = self._make_request("/files/get_backups_data", method='get')
-            data = response.json()
+            response = await self._request("/files/get_backups_data", method='get')
+            data = _loads(response.content)
             logger.debug("Backups metadata retrieved successfully")
-            logger.debug(f"Server response: {response.json()}")
+            logger.debug(f"Server response: {data}")
             return data
         except Exception as e:
             logger.error(f"Failed to retrieve backups data: {e}", exc_info=True)
@@ -359,13 +533,15 @@ class APIClient:
     async def restore_backup(self, game_name: str, backup_name: str) -> int|None:
         """Restore a specific backup."""
         try:
-            response = self._make_request(
+            response = await self._request(
                 "/files/restore_backup",
                 method="post",
-                json={"game_name": game_name, "backup_name": backup_name}
+                data=_dumps({"game_name": game_name, "backup_name": backup_name}),
+                headers=dict(JSON_HEADERS)
             )
 
-            logger.debug(f"Server response: {response.json()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Server response: {response.text}")
             if response.status_code == 200:
                 logger.info(f"Backup '{backup_name}' for game '{game_name}' restored successfully")
                 return response.status_code
@@ -379,12 +555,14 @@ class APIClient:
     async def delete_backup(self, game_name: str, backup_name: str) -> int|None:
         """Delete a backup on server."""
         try:
-            response = self._make_request(
+            response = await self._request(
                 "/files/delete_backup",
                 method="delete",
-                json={"game_name": game_name, "backup_name": backup_name}
+                data=_dumps({"game_name": game_name, "backup_name": backup_name}),
+                headers=dict(JSON_HEADERS)
             )
-            logger.debug(f"Server response: {response.json()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Server response: {response.text}")
             if response.status_code == 200:
                 logger.info(f"Backup '{backup_name}' for game '{game_name}' deleted")
                 return response.status_code
@@ -401,8 +579,8 @@ class APIClient:
     async def test_token(self) -> bool:
         """Validate API token."""
         try:
-            response = self._make_request('/manage/check_x_token', method='get')
-            if response.status_code == 200 and response.json().get('token_status') is True:
+            response = await self._request('/manage/check_x_token', method='get')
+            if response.status_code == 200 and _loads(response.content).get('token_status') is True:
                 logger.info("API token is valid")
                 return response.status_code
             else:
@@ -415,14 +593,24 @@ class APIClient:
     async def check_server_health(self, host_for_check: Optional[str] = None) -> bool:
         """Check if server is alive."""
         url = f"{host_for_check or self.host}/manage/health"
+
+        # A recent successful check of the same URL is trusted as is
+        if self._last_health is not None:
+            checked_url, checked_at = self._last_health
+            if checked_url == url and time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+                return True
+
         try:
-            response = requests.get(url, timeout=5)
+            response = await asyncio.to_thread(self._probe_session.get, url, timeout=5, allow_redirects=False)
             is_healthy = response.status_code == 200
             if is_healthy:
+                self._last_health = (url, time.monotonic())
                 logger.debug("Server health check passed")
             else:
+                self._last_health = None
                 logger.warning(f"Server health check failed: HTTP {response.status_code}")
             return is_healthy
         except requests.exceptions.RequestException as e:
+            self._last_health = None
             logger.error(f"Server health check failed: {e}")
             return False
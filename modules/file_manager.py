@@ -1,94 +1,210 @@
 # Copyright (C) 2025 IAMVanilka
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import asyncio
 import os
 import shutil
 import tarfile
 import hashlib
 import logging
+import concurrent.futures
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Пул для хеширования: hashlib отпускает GIL на больших буферах, так что файлы хешируются параллельно
+_hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="Hasher")
+
+def _collect_files(base_dir) -> list:
+    """Итеративно (без рекурсии) собирает пути всех файлов в папке"""
+    files_paths = []
+    stack = [base_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files_paths.append(entry.path)
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return files_paths
+
+def _hash_one(path) -> str:
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, 'md5').hexdigest()
+
 async def hash_generator(base_dir) -> dict:
     """Сканирует папку и генерирует словарь {'file_path': 'md5_hash'}"""
+    loop = asyncio.get_running_loop()
+    files_paths = await loop.run_in_executor(_hash_pool, _collect_files, base_dir)
+    hashes = await asyncio.gather(*(loop.run_in_executor(_hash_pool, _hash_one, path) for path in files_paths))
 
-    dir_name = base_dir.split("/")[-1]
-    files_data = dict()
+    # Ключ — путь относительно base_dir с ведущим разделителем, в том виде, в каком его ждёт сервер
+    prefix_len = len(base_dir.rstrip("/\\"))
+    return {path[prefix_len:]: md5_hash for path, md5_hash in zip(files_paths, hashes)}
 
-    def scan_directory(directory):
-        with os.scandir(directory) as entries:
-            for entry in entries:
-                if entry.is_file():
-                    with open(entry.path, "rb") as file:
-                        md5_hash = hashlib.file_digest(file, 'md5')
-                        files_data[(entry.path.split(dir_name)[1])] = md5_hash.hexdigest()
-                elif entry.is_dir():
-                    scan_directory(entry.path)
 
-    scan_directory(base_dir)
-    return files_data
+# Как часто поток-писатель проверяет, жив ли читатель, пока ждёт места в очереди
+PUT_POLL_INTERVAL = 0.5
+
+
+class _QueueWriter:
+    """Файлоподобный приёмник для tarfile: собирает вывод в чанки и передаёт их в asyncio.Queue.
+    Пока очередь заполнена, поток-писатель ждёт — так расход памяти ограничен размером очереди"""
+
+    def __init__(self, queue: asyncio.Queue, loop: asyncio.AbstractEventLoop, chunk_size: int):
+        self._queue = queue
+        self._loop = loop
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self.reader_gone = False
+
+    def _put(self, item):
+        if self.reader_gone:
+            raise BrokenPipeError("Archive reader has stopped")
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._queue.put(item), self._loop)
+        except RuntimeError:
+            raise BrokenPipeError("Event loop is closed")
+        # Ждём с таймаутом, чтобы заметить остановку цикла: после неё очередь уже никто не разберёт
+        while True:
+            try:
+                future.result(timeout=PUT_POLL_INTERVAL)
+                return
+            except concurrent.futures.TimeoutError:
+                if self.reader_gone or self._loop.is_closed() or not self._loop.is_running():
+                    future.cancel()
+                    raise BrokenPipeError("Archive reader has stopped")
+
+    def write(self, data):
+        self._buffer += data
+        if len(self._buffer) >= self._chunk_size:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def finish(self, error: Exception | None = None):
+        """Отправляет остаток данных и признак конца потока (None) или ошибку писателя"""
+        if error is None and self._buffer:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+        self._put(error)
+
+
+# Расширения файлов, которые уже сжаты: повторный gzip для них лишь тратит CPU
+PRECOMPRESSED_EXTENSIONS = frozenset({
+    ".zip", ".7z", ".rar", ".gz", ".bz2", ".xz", ".zst", ".lz4",
+    ".jpg", ".jpeg", ".png", ".webp", ".mp4", ".ogg", ".mp3", ".xnb",
+})
+
+
+def _archive_compresslevel(files_paths: list) -> int:
+    """Уровень gzip для архива: 0 (без сжатия, только обёртка gzip), если
+    большая часть байт приходится на уже сжатые файлы, иначе 1"""
+    total = packed = 0
+    for file in files_paths:
+        try:
+            size = os.path.getsize(file)
+        except OSError:
+            continue
+        total += size
+        if os.path.splitext(file)[1].lower() in PRECOMPRESSED_EXTENSIONS:
+            packed += size
+    return 0 if total and packed * 2 > total else 1
 
 
-async def create_archive_chunk_generator(base_dir: str, files_paths: list, CHUNK_SIZE = 65536):
+async def create_archive_chunk_generator(base_dir: str, files_paths: list, chunk_size: int = 1 << 20):
     """
      Генератор, который потоково создаёт .tar.gz и возвращает чанки.
-     Работает в отдельном потоке, чтобы не блокировать async event loop.
+     Архив собирается в отдельном фоновом (daemon) потоке и передаётся через ограниченную asyncio.Queue,
+     поэтому чтение чанков не блокирует async event loop.
      """
-    read_fd, write_fd = os.pipe()
-
-    exception_occurred = threading.Event()
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=4)
+    sink = _QueueWriter(queue, loop, chunk_size)
 
     def writer():
-        """Функция для рекурсивной загрузки данных в пайпу"""
+        """Упаковывает файлы в архив и передаёт его чанки в очередь"""
+        error = None
         try:
-            with os.fdopen(write_fd, "wb") as wf:
-                with tarfile.open(fileobj=wf, mode="w:gz", compresslevel=6) as tar:
-                    for file in files_paths:
-                        if os.path.exists(file):
-                            relative_path = file.split(base_dir)[1]
-                            tar.add(file, arcname=relative_path)
+            compresslevel = _archive_compresslevel(files_paths)
+            with tarfile.open(fileobj=sink, mode="w:gz", compresslevel=compresslevel) as tar:
+                for file in files_paths:
+                    if os.path.exists(file):
+                        tar.add(file, arcname=os.path.relpath(file, base_dir))
+                        if logger.isEnabledFor(logging.DEBUG):
                             logger.debug(f"Обрабатываю файл {file}")
 
         except BrokenPipeError:
-            logger.debug("ℹ️  Pipe closed by reader (normal behavior)")
-            pass
+            logger.debug("ℹ️  Archive reader stopped (normal behavior)")
+            return
         except Exception as e:
             logger.error(f"❌ Writer error: {e}", exc_info=True)
-            exception_occurred.set()
+            error = e
+
+        try:
+            sink.finish(error)
+        except BrokenPipeError:
+            pass
 
-    thread = threading.Thread(target=writer, daemon=True)
-    thread.start()
+    # Daemon-поток, а не пул по умолчанию: незавершённая выгрузка не задерживает выход из приложения
+    threading.Thread(target=writer, name="ArchiveWriter", daemon=True).start()
 
-    with os.fdopen(read_fd, "rb") as rf:
+    try:
         while True:
-            chunk = rf.read(CHUNK_SIZE)
-            if not chunk:
+            chunk = await queue.get()
+            if chunk is None:
                 break
+            if isinstance(chunk, Exception):
+                raise chunk
             yield chunk
-
-
-async def get_archive_chunks(file, path_to_saves: str):
+    finally:
+        # Читатель ушёл: освобождаем очередь, чтобы писатель не завис на put и завершился
+        sink.reader_gone = True
+        while not queue.empty():
+            queue.get_nowait()
+
+
+async def get_archive_chunks(chunks, path_to_saves: str):
+    """Распаковывает архив по мере скачивания (сеть → gunzip → untar) без временного файла.
+    Распаковка идёт в соседнюю папку, которая подменяет сохранения только после успешного завершения.
+    При ошибке (обрыв, повреждённый архив) папка распаковки удаляется, а исключение пробрасывается"""
+    loop = asyncio.get_running_loop()
+    staging_dir = path_to_saves.rstrip("/\\") + ".mnemy-download"
     try:
-        file.raise_for_status()
+        if os.path.exists(staging_dir):
+            shutil.rmtree(staging_dir)
+        os.mkdir(staging_dir)
 
-        if not os.path.exists("temp_data"):
-            os.mkdir("temp_data")
+        read_fd, write_fd = os.pipe()
 
-        with open("temp_data/downloaded_saves.tar.gz", "wb") as f:
-            for chunk in file.iter_content(chunk_size=64 * 1024):
-                f.write(chunk)
+        def extract():
+            with os.fdopen(read_fd, "rb") as rf:
+                with tarfile.open(fileobj=rf, mode="r|gz") as tar:
+                    tar.extractall(path=staging_dir, filter='data')
 
-        with tarfile.open("temp_data/downloaded_saves.tar.gz", "r:gz") as tar:
-            if not os.path.exists(path_to_saves):
-                os.mkdir(path_to_saves)
-            else:
+        extractor = loop.run_in_executor(None, extract)
+        try:
+            with os.fdopen(write_fd, "wb") as wf:
+                async for chunk in chunks:
+                    await loop.run_in_executor(None, wf.write, chunk)
+        except BrokenPipeError:
+            logger.debug("ℹ️  Pipe closed by extractor")
+        finally:
+            # Папки трогаем только после того, как распаковщик дочитал пайп
+            await asyncio.wait([extractor])
+        extractor.result()
+
+        def swap():
+            if os.path.exists(path_to_saves):
                 shutil.rmtree(path_to_saves)
-                os.mkdir(path_to_saves)
-
-            tar.extractall(path=path_to_saves)
+            os.replace(staging_dir, path_to_saves)
 
-        os.remove('temp_data/downloaded_saves.tar.gz')
+        await loop.run_in_executor(None, swap)
 
-    except Exception as e:
-        logger.error(e, exc_info=True)
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
@@ -1,16 +1,28 @@
+import atexit
 import logging
 import os.path
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 def setup_logging():
     if not os.path.exists("logs"):
         os.mkdir("logs")
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s — %(name)s — %(levelname)s — %(message)s",
-        handlers=[
-            logging.FileHandler(f"logs/mnemy_{datetime.now().date()}.log", encoding="utf-8"),
-            logging.StreamHandler()
-        ]
-    )
\ No newline at end of file
+    formatter = logging.Formatter("%(asctime)s — %(name)s — %(levelname)s — %(message)s")
+    handlers = [
+        logging.FileHandler(f"logs/mnemy_{datetime.now().date()}.log", encoding="utf-8"),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Запись в файл и консоль идёт в фоновом потоке: вызов логгера лишь кладёт запись в очередь
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
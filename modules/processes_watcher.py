@@ -27,97 +27,121 @@ logger.addHandler(logger_handler)
 class ProcessWatcher:
     def __init__(self, main_window):
         self.games_data = dict()
+        # Нормализованное имя процесса -> (имя процесса, game_id, данные игры)
+        self._target_map = dict()
+        # Процессы, уже проверенные при ожидании запуска: (pid, время создания, имя).
+        # Время создания отличает переиспользованный PID, имя — exec лаунчера в игру под тем же PID
+        self._seen_processes = set()
         self.main_window = main_window
 
-    def _normalize_name(self, name):
-        if name.lower().endswith('.exe'):
-            return name[:-4]  # Отбрасываем последние 4 символа (.exe)
-        elif name.lower().endswith('.'):
-            return name[:-1]
-        return name
-
-    def _check_process(self, process_name):
-        """Проверяет, запущен ли процесс"""
-        target_name = self._normalize_name(process_name).lower()
-
+    @staticmethod
+    def _normalize_name(name):
+        """Имя процесса в нижнем регистре без .exe и завершающих точек"""
+        return name.lower().removesuffix('.exe').rstrip('.')
+
+    def _check_new_processes(self):
+        """Проверяет только процессы, появившиеся с прошлой проверки.
+        Возвращает (процесс, (имя процесса, game_id, данные игры)) или None"""
+        seen = set()
+        found = None
+        for proc in psutil.process_iter(['name', 'create_time']):
+            key = (proc.pid, proc.info['create_time'], proc.info['name'])
+            seen.add(key)
+            if found is not None or key in self._seen_processes or not proc.info['name']:
+                continue
+            target = self._target_map.get(self._normalize_name(proc.info['name']))
+            if target is not None:
+                found = proc, target
+        self._seen_processes = seen
+        return found
+
+    def _find_process(self, target_name):
+        """Ищет запущенный процесс по нормализованному имени"""
         for proc in psutil.process_iter(['name']):
             try:
-                proc_name = self._normalize_name(proc.info['name']).lower()
-                if target_name == proc_name:
-                    return True
+                proc_name = proc.info['name']
+                if proc_name and self._normalize_name(proc_name) == target_name:
+                    return proc
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
-        return False
-
-    def _check_any_process_from_list(self):
-        """Проверяет, запущен ли хотя бы один процесс из списка"""
-        for game_id, game_data in self.games_data.items():
-            process_name = game_data['game_path'].split("/")[-1] if game_data["game_path"] is not None else None
-            if process_name is None:
-                continue
-            if self._check_process(process_name):
-                return process_name, game_id, game_data
         return None
 
     def _wait_for_any_process_start(self):
         """Ждет запуска любого процесса из списка"""
+        self._seen_processes = set()
         while True:
-            running_process_data = self._check_any_process_from_list()
+            running_process_data = self._check_new_processes()
             if running_process_data:
                 return running_process_data
             logger.info('Still waiting for any process to start...')
-            self._get_all_processes()
             time.sleep(10)
-
-    def _wait_for_process_exit(self, process_name):
-        """Ждет завершения конкретного процесса"""
-        target_name = self._normalize_name(process_name).lower()
-
-        while True:
-            process_found = False
-            for proc in psutil.process_iter(['name']):
-                try:
-                    proc_name = self._normalize_name(proc.info['name']).lower()
-                    if target_name == proc_name:
-                        process_found = True
-                        break
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-
-            if not process_found:
-                return
-
-            time.sleep(1)
+            # get_all_games отдаёт кэш, пока игры не менялись: карта целей пересобирается
+            # только после добавления, изменения или удаления игры
+            if get_all_games() is not self.games_data:
+                previous_targets = set(self._target_map)
+                self._get_all_processes()
+                if set(self._target_map) != previous_targets:
+                    # Список игр изменился: уже запущенные процессы нужно проверить заново
+                    self._seen_processes = set()
+
+    def _wait_for_process_exit(self, proc, process_name):
+        """Ждет завершения процесса через ожидание ОС, без периодического опроса.
+        Если игра перезапустилась под тем же именем, ждёт и новый процесс"""
+        target_name = self._normalize_name(process_name)
+
+        while proc is not None:
+            try:
+                proc.wait()
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.AccessDenied:
+                # Нет прав на ожидание (например, игра запущена с повышенными правами): опрашиваем раз в секунду
+                while proc.is_running():
+                    time.sleep(1)
+            proc = self._find_process(target_name)
 
     def _get_all_processes(self):
         self.games_data = get_all_games()
 
-        process_names = [game_data['game_path'].split("/")[-1] for game_data in self.games_data.values() if
-                         game_data["game_path"] is not None]
-        logger.info(f"Processes to monitor: {process_names}")
+        target_map = dict()
+        for game_id, game_data in self.games_data.items():
+            if game_data["game_path"] is None:
+                continue
+            process_name = os.path.basename(game_data['game_path'])
+            target_map.setdefault(self._normalize_name(process_name), (process_name, game_id, game_data))
+        self._target_map = target_map
+
+        if logger.isEnabledFor(logging.INFO):
+            process_names = [target[0] for target in target_map.values()]
+            logger.info(f"Processes to monitor: {process_names}")
         return self.games_data
 
     def _monitor_processes(self):
         """Основная функция мониторинга списка процессов"""
         from modules.API_client import APIClient
-        api_client = APIClient()
+        api_client = APIClient.instance()
 
         logger.info('Process watcher started!')
+        # Свой постоянный цикл: сессия API-клиента переиспользуется между синхронизациями
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
 
         try:
             while True:
+                # Список игр обновляется при старте и после каждой синхронизации
+                self._get_all_processes()
                 logger.info("Waiting for any process to start...")
-                running_process, game_id, game_data = self._wait_for_any_process_start()
+                proc, (running_process, game_id, game_data) = self._wait_for_any_process_start()
                 logger.info(f'Process "{running_process}" has been detected! Waiting for it to exit...')
 
-                self._wait_for_process_exit(running_process)
+                self._wait_for_process_exit(proc, running_process)
                 logger.info(f'Process "{running_process}" has been killed!')
                 self.main_window.send_notif(f"Игра {game_data['game_name']} завершена.\n"
                                             f"Начинаю синхронизацию сохранений...")
 
                 logger.info(f'Starting saves synchronizing...')
-                asyncio.run(sync_saves_action(game_name=game_data['game_name'], saves_path=game_data['saves_path'] ,
-                                              game_id=game_id, api_client=api_client))
+                loop.run_until_complete(sync_saves_action(game_name=game_data['game_name'], saves_path=game_data['saves_path'] ,
+                                                          game_id=game_id, api_client=api_client))
                 logger.info(f'Synchronizing successfully done!')
                 self.main_window.send_notif(f"Синхронизация для {game_data['game_name']} завершена!")
 
@@ -125,12 +149,11 @@ class ProcessWatcher:
             logger.info("\nProcess watcher stopped...")
         except Exception as e:
             logger.error(e)
-
-    def _start_threading(self):
-        self._get_all_processes()
-        self._monitor_processes()
+        finally:
+            loop.run_until_complete(api_client.aclose())
+            loop.close()
 
     def run(self):
-        thread = threading.Thread(target=self._start_threading, daemon=True)
+        thread = threading.Thread(target=self._monitor_processes, daemon=True)
         thread.start()
         return thread
@@ -1,10 +1,12 @@
 # Copyright (C) 2025 IAMVanilka
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import atexit
 import datetime
 import logging
+import threading
 
-from sqlalchemy import create_engine, Column, String, Integer, DateTime
+from sqlalchemy import create_engine, event, Column, String, Integer, DateTime
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
@@ -12,7 +14,61 @@ from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
-engine = create_engine('sqlite:///app_database.db', echo=False)
+DATABASE_PATH = "app_database.db"
+
+# Один пишущий и несколько читающих соединений: в режиме WAL чтение идёт параллельно с записью,
+# а единственное пишущее соединение исключает SQLITE_BUSY при конкурирующих транзакциях записи
+write_engine = create_engine(
+    f"sqlite:///{DATABASE_PATH}",
+    echo=False,
+    pool_size=1,
+    max_overflow=0,
+    connect_args={"check_same_thread": False, "timeout": 5}
+)
+
+read_engine = create_engine(
+    f"sqlite:///file:{DATABASE_PATH}?mode=ro&uri=true",
+    echo=False,
+    pool_size=4,
+    connect_args={"check_same_thread": False, "timeout": 5}
+)
+
+# WAL и synchronous=NORMAL: меньше fsync на каждый коммит, чтение не блокируется записью.
+# Выполняется для каждого нового соединения пула
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+@event.listens_for(write_engine, "connect")
+def _set_write_pragmas(dbapi_connection, connection_record):
+    # Режим журнала хранится в самом файле БД, поэтому переключает его только пишущее соединение
+    dbapi_connection.execute("PRAGMA journal_mode=WAL")
+    _set_sqlite_pragmas(dbapi_connection, connection_record)
+
+event.listen(read_engine, "connect", _set_sqlite_pragmas)
+
+@event.listens_for(write_engine, "close")
+def _optimize_on_close(dbapi_connection, connection_record):
+    # Обновляет статистику планировщика, если таблицы заметно изменились (рекомендация SQLite)
+    try:
+        dbapi_connection.execute("PRAGMA optimize")
+    except Exception as e:
+        logger.debug("PRAGMA optimize failed: %s", e)
+
+# Закрываем соединения пула при выходе, чтобы PRAGMA optimize выполнился
+atexit.register(write_engine.dispose)
 
 Base = declarative_base()
 
@@ -33,12 +89,27 @@ class Game(Base):
     def __repr__(self):
         return f"<Game(id={self.id}, name='{self.game_name}')>"
 
-Base.metadata.create_all(engine)
+Base.metadata.create_all(write_engine)
+
+# Фабрики сессий создаются один раз; объекты остаются доступны после коммита
+WriteSession = sessionmaker(bind=write_engine, expire_on_commit=False)
+ReadSession = sessionmaker(bind=read_engine)
+
+# Кэш результата get_all_games. Сбрасывается каждой изменяющей функцией;
+# поколение защищает от записи в кэш данных, прочитанных до изменения
+_games_cache = None
+_games_cache_generation = 0
+_cache_lock = threading.Lock()
+
+def _invalidate_games_cache():
+    global _games_cache, _games_cache_generation
+    with _cache_lock:
+        _games_cache = None
+        _games_cache_generation += 1
 
 @contextmanager
-def create_session():
-    Session = sessionmaker(bind=engine)
-    session = Session()
+def write_session():
+    session = WriteSession()
     try:
         yield session
         session.commit()
@@ -50,13 +121,21 @@ def create_session():
     finally:
         session.close()
 
+@contextmanager
+def read_session():
+    session = ReadSession()
+    try:
+        yield session
+    finally:
+        session.close()
+
 def add_new_game(game_name: str = None, game_path: str = None, saves_path: str = None, image_path: str = None) -> bool:
     if not game_name:
         logger.error("Game name is required but not provided")
         return False
 
     try:
-        with create_session() as session:
+        with write_session() as session:
             new_game = Game(
                 game_name=game_name,
                 game_path=game_path,
@@ -65,6 +144,7 @@ def add_new_game(game_name: str = None, game_path: str = None, saves_path: str =
             )
             session.add(new_game)
 
+        _invalidate_games_cache()
         logger.info(
             f"Game '{game_name}' added successfully. Saves path: '{saves_path}', executable path: '{game_path}'"
         )
@@ -80,18 +160,45 @@ def add_new_game(game_name: str = None, game_path: str = None, saves_path: str =
         logger.critical("Unexpected error while adding game '%s': %s", game_name, e, exc_info=True)
         return False
 
+def add_new_games_bulk(games: list[dict]) -> bool:
+    """Добавляет несколько игр одной транзакцией (один коммит на весь список)"""
+    if not games:
+        return True
+    if any(not game.get("game_name") for game in games):
+        logger.error("Game name is required for every game in bulk insert")
+        return False
+
+    try:
+        with write_session() as session:
+            session.add_all([Game(**game) for game in games])
+
+        _invalidate_games_cache()
+        logger.info("Added %s games: %s", len(games), ", ".join(game["game_name"] for game in games))
+        return True
+
+    except IntegrityError as e:
+        logger.error("Integrity error while adding games in bulk: %s", e)
+        return False
+    except SQLAlchemyError as e:
+        logger.error("Database error while adding games in bulk: %s", e, exc_info=True)
+        return False
+    except Exception as e:
+        logger.critical("Unexpected error while adding games in bulk: %s", e, exc_info=True)
+        return False
+
 def delete_game(game_id: int) -> bool:
     if not isinstance(game_id, int) or game_id <= 0:
         logger.error("Invalid game ID for deletion: %s", game_id)
         return False
 
     try:
-        with create_session() as session:
+        with write_session() as session:
             result = session.query(Game).filter(Game.id == game_id).delete()
             if result == 0:
                 logger.warning("Attempted to delete non-existent game with ID %s", game_id)
                 return False
 
+        _invalidate_games_cache()
         logger.info("Game with ID %s deleted successfully", game_id)
         return True
 
@@ -114,35 +221,33 @@ def update_game(
         return False
 
     try:
-        with create_session() as session:
-            game = session.query(Game).filter(Game.id == game_id).first()
-            if not game:
+        values = {
+            field: value
+            for field, value in (
+                ("game_name", game_name),
+                ("saves_path", saves_path),
+                ("game_path", game_path),
+                ("image_path", image_path),
+            )
+            if value is not None
+        }
+        if not values:
+            logger.debug("No fields to update for game ID %s", game_id)
+            return True
+
+        # Один UPDATE по первичному ключу вместо SELECT + UPDATE через ORM
+        with write_session() as session:
+            updated = session.query(Game).filter(Game.id == game_id).update(values, synchronize_session=False)
+            if updated == 0:
                 logger.warning("Game with ID %s not found for update", game_id)
                 return False
 
-            updated_fields = []
-            if game_name is not None:
-                game.game_name = game_name
-                updated_fields.append("game_name")
-            if saves_path is not None:
-                game.saves_path = saves_path
-                updated_fields.append("saves_path")
-            if game_path is not None:
-                game.game_path = game_path
-                updated_fields.append("game_path")
-            if image_path is not None:
-                game.image_path = image_path
-                updated_fields.append("image_path")
-
-            if not updated_fields:
-                logger.debug("No fields to update for game ID %s", game_id)
-                return True
-
-        logger.info("Game ID %s updated: %s", game_id, ", ".join(updated_fields))
+        _invalidate_games_cache()
+        logger.info("Game ID %s updated: %s", game_id, ", ".join(values))
         return True
 
-    except (IntegrityError, sqlite3.IntegrityError) as e:
-        logger.error("Integrity error while adding game '%s': %s", game_name, e, exc_info=True)
+    except IntegrityError as e:
+        logger.error("Integrity error while updating game ID %s: %s", game_id, e, exc_info=True)
         return False
     except SQLAlchemyError as e:
         logger.error("Database error while updating game ID %s: %s", game_id, e, exc_info=True)
@@ -157,7 +262,7 @@ def update_sync_time(game_id: int, date: datetime) -> bool:
         return False
 
     try:
-        with create_session() as session:
+        with write_session() as session:
             game = session.query(Game).filter(Game.id == game_id).first()
             if not game:
                 logger.warning("Game with ID %s not found when updating sync time", game_id)
@@ -165,6 +270,7 @@ def update_sync_time(game_id: int, date: datetime) -> bool:
 
             game.last_sync_date = date
 
+        _update_cached_sync_time(game_id, date)
         logger.debug("Sync time for game ID %s updated to %s", game_id, date)
         return True
 
@@ -176,11 +282,27 @@ def update_sync_time(game_id: int, date: datetime) -> bool:
         return False
 
 
+def _update_cached_sync_time(game_id: int, date: datetime):
+    """Обновляет дату синхронизации в кэше без его сброса.
+    Словари кэша не изменяются на месте: уже выданные вызывающим данные остаются прежними"""
+    global _games_cache, _games_cache_generation
+    with _cache_lock:
+        _games_cache_generation += 1
+        if _games_cache is not None and game_id in _games_cache:
+            _games_cache = {**_games_cache, game_id: {**_games_cache[game_id], "last_sync_date": date}}
+
 def get_all_games():
+    """Все игры {id: данные}. Результат кэшируется; возвращаемый словарь нельзя изменять"""
+    global _games_cache
+    with _cache_lock:
+        if _games_cache is not None:
+            return _games_cache
+        generation = _games_cache_generation
+
     try:
-        with create_session() as session:
+        with read_session() as session:
             games = session.query(Game).all()
-            return {
+            result = {
                 game.id: {
                     "game_name": game.game_name,
                     "game_path": game.game_path,
@@ -190,6 +312,10 @@ def get_all_games():
                 }
                 for game in games
             }
+        with _cache_lock:
+            if generation == _games_cache_generation:
+                _games_cache = result
+        return result
     except SQLAlchemyError as e:
         logger.error("Database error while fetching all games", exc_info=True)
         return {}
@@ -203,7 +329,7 @@ def get_game_by_name(game_name: str):
         return None
 
     try:
-        with create_session() as session:
+        with read_session() as session:
             game = session.query(Game).filter(Game.game_name == game_name).first()
             if not game:
                 logger.debug("Game '%s' not found in database", game_name)
@@ -1,52 +1,100 @@
 # Copyright (C) 2025 IAMVanilka
 # SPDX-License-Identifier: GPL-3.0-or-later
 import logging
+import threading
 import traceback
 
 from PySide6.QtCore import QObject, Signal
-from concurrent.futures import ThreadPoolExecutor
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Единый постоянный событийный цикл для всех AsyncRunner: он живёт в фоновом потоке,
+# поэтому привязанные к нему ресурсы (например, aiohttp-сессия) переиспользуются между задачами
+_loop = None
+_loop_lock = threading.Lock()
+
+def _get_loop():
+    """Возвращает общий цикл, при первом вызове запуская его поток"""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_run_loop, args=(loop,), name="AsyncRunnerLoop", daemon=True)
+            thread.start()
+            _loop = loop
+        return _loop
+
+def _run_loop(loop):
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+def stop_async_loop(cleanup=None, timeout: float = 2.0):
+    """Останавливает общий цикл при выходе из приложения.
+    cleanup — асинхронная функция без аргументов, выполняемая в цикле перед остановкой"""
+    global _loop
+    with _loop_lock:
+        loop, _loop = _loop, None
+    if loop is None or loop.is_closed():
+        return
+    if cleanup is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(cleanup(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Async cleanup failed: {e}")
+    # Незавершённые задачи отменяются, чтобы отработали их finally (например, остановка потока архивации)
+    try:
+        asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), loop).result(timeout)
+    except Exception as e:
+        logger.warning(f"Cancelling pending tasks failed: {e}")
+    loop.call_soon_threadsafe(loop.stop)
+
+async def _cancel_pending_tasks():
+    """Отменяет все задачи цикла, кроме текущей, дожидается их и закрывает асинхронные генераторы"""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.get_running_loop().shutdown_asyncgens()
+
 class AsyncRunner(QObject):
     finished = Signal(bool)
     error = Signal(object)
     progress = Signal(str)
     result = Signal(object)
 
-    def __init__(self):
-        super().__init__()
-        self.executor = ThreadPoolExecutor(max_workers=2)
-
     def run_async(self, coro_func, *args, **kwargs):
-        """Запуск асинхронной функции"""
-
-        def run_in_thread():
-            try:
-                self.progress.emit("")
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-                if kwargs:
-                    coro = coro_func(*args, **kwargs)
-                else:
-                    coro = coro_func(*args)
-
-                result = loop.run_until_complete(coro)
-                loop.close()
+        """Запуск асинхронной функции в общем цикле"""
+        self.progress.emit("")
+        try:
+            coro = coro_func(*args, **kwargs)
+            future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+        except Exception as e:
+            self._emit_error(e)
+            return
+        future.add_done_callback(self._on_done)
 
-                print("Inside async runner:", result)
+    def _on_done(self, future):
+        """Передаёт результат задачи в сигналы (вызывается в потоке цикла)"""
+        try:
+            result = future.result()
+        except Exception as e:
+            self._emit_error(e)
+            return
 
-                self.result.emit(result)
-                self.finished.emit(result)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Inside async runner: %r", result)
 
-            except Exception as e:
-                error_info = {
-                    'exception': e,
-                    'traceback': traceback.format_exc()
-                }
-                self.error.emit(error_info)
+        self.result.emit(result)
+        self.finished.emit(result)
 
-        self.executor.submit(run_in_thread)
\ No newline at end of file
+    def _emit_error(self, e):
+        error_info = {
+            'exception': e,
+            'traceback': ''.join(traceback.format_exception(e))
+        }
+        self.error.emit(error_info)
@@ -6,22 +6,14 @@ import logging
 import os
 import shutil
 
-from modules.sqls import update_sync_time, add_new_game, get_all_games, get_game_by_name
+from modules.sqls import update_sync_time, add_new_games_bulk, get_all_games, get_game_by_name
 from modules.API_client import APIClient
 
 logger = logging.getLogger(__name__)
 
 def get_utc_time(date: datetime):
-    import time
-    import datetime
-    import pytz
-
-    local_offset = time.timezone if time.daylight == 0 else time.altzone
-    local_tz = pytz.FixedOffset(-local_offset // 60)
-
-    last_sync_aware = local_tz.localize(date)
-    last_sync_utc = last_sync_aware.astimezone(datetime.timezone.utc)
-    return last_sync_utc
+    # Наивная дата трактуется как локальное время (с учётом перехода на летнее время на эту дату)
+    return date.astimezone(datetime.timezone.utc)
 
 async def sync_saves_action(game_name: str, saves_path: str, game_id: int, api_client: APIClient):
     last_sync_date = get_game_by_name(game_name)["last_sync_date"]
@@ -40,10 +32,11 @@ async def sync_saves_action(game_name: str, saves_path: str, game_id: int, api_c
         return await download_saves_action(game_name, saves_path, game_id, api_client)
 
 async def download_saves_action(game_name: str, saves_path: str, game_id: int, api_client: APIClient):
-    status = await api_client.download_files(game_name, saves_path, delete_saves_folder=True)
-    if status:
+    status = await api_client.download_files(game_name, saves_path)
+    # Время синхронизации фиксируется только при полностью распакованном архиве
+    if status == 200:
         update_sync_time(game_id=game_id, date=datetime.datetime.now())
-        return status
+    return status
 
 async def delete_from_server_action(game_name: str, delete_backups: bool, api_client: APIClient):
     return await api_client.delete_game(game_name, delete_backups=True if delete_backups else False)
@@ -57,20 +50,27 @@ async def set_up_games_data(api_client: APIClient):
 
     local_game_names = {game_item['game_name'] for game_item in games_list_local.values()}
 
-    new_games_list = [game_name for game_name in games_list if game_name not in local_game_names]
-    for game in new_games_list:
-        add_status = add_new_game(game_name=game)
+    # Сервер может вернуть как имена игр, так и словари с полем game_name
+    remote_game_names = [game["game_name"] if isinstance(game, dict) else game for game in games_list]
+    # dict.fromkeys убирает повторы, сохраняя порядок сервера
+    new_games_list = [game_name for game_name in dict.fromkeys(remote_game_names) if game_name not in local_game_names]
+    if new_games_list:
+        add_status = add_new_games_bulk([{"game_name": game} for game in new_games_list])
         if not add_status:
             return add_status
 
-    await load_games_covers(api_client)
+    # Список игр перечитывается, только если в него что-то добавилось
+    if new_games_list:
+        games_list_local = get_all_games()
+    await load_games_covers(api_client, games_list_local)
 
     return True
 
-async def load_games_covers(api_client: APIClient):
-    games_data = get_all_games()
-    games_data = [game["game_name"] for game in games_data.values()]
-    await api_client.get_games_images(games_data, steam=True)
+async def load_games_covers(api_client: APIClient, games_data: dict = None):
+    if games_data is None:
+        games_data = get_all_games()
+    games_names = [game["game_name"] for game in games_data.values()]
+    await api_client.get_games_images(games_names, steam=True)
 
 async def get_backups_data_action(api_client: APIClient):
     backups_data = await api_client.get_backups_data()
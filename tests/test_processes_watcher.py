@@ -0,0 +1,85 @@
+import importlib
+
+import pytest
+
+
+class FakeProcess:
+    def __init__(self, pid, name, create_time):
+        self.pid = pid
+        self.info = {"name": name, "create_time": create_time}
+
+
+@pytest.fixture
+def watcher(tmp_path, monkeypatch):
+    # Импорт модуля создаёт logs/ и app_database.db в текущей папке
+    monkeypatch.chdir(tmp_path)
+    processes_watcher = importlib.import_module("modules.processes_watcher")
+    running = []
+    monkeypatch.setattr(processes_watcher.psutil, "process_iter", lambda attrs=None: iter(running))
+
+    watcher = processes_watcher.ProcessWatcher(main_window=None)
+    game_data = {"game_name": "Game", "game_path": "C:/Games/Game.exe"}
+    watcher._target_map = {"game": ("Game.exe", 1, game_data)}
+    return watcher, running
+
+
+def test_new_process_is_detected(watcher):
+    watcher, running = watcher
+    running[:] = [FakeProcess(100, "explorer.exe", 1.0)]
+    assert watcher._check_new_processes() is None
+
+    running.append(FakeProcess(200, "Game.exe", 2.0))
+    proc, target = watcher._check_new_processes()
+    assert proc.pid == 200
+    assert target[1] == 1
+
+
+def test_reused_pid_is_checked_again(watcher):
+    watcher, running = watcher
+    running[:] = [FakeProcess(100, "updater.exe", 1.0)]
+    assert watcher._check_new_processes() is None
+
+    # Игра запустилась под тем же PID, который в прошлом снимке занимал другой процесс
+    running[:] = [FakeProcess(100, "Game.exe", 5.0)]
+    proc, _ = watcher._check_new_processes()
+    assert proc.pid == 100
+
+
+def test_exec_under_same_pid_is_checked_again(watcher):
+    watcher, running = watcher
+    running[:] = [FakeProcess(100, "launcher", 1.0)]
+    assert watcher._check_new_processes() is None
+
+    # Лаунчер выполнил exec в игру: PID и время создания те же, имя другое
+    running[:] = [FakeProcess(100, "Game.exe", 1.0)]
+    proc, _ = watcher._check_new_processes()
+    assert proc.pid == 100
+
+
+def test_already_seen_game_is_not_reported_twice(watcher):
+    watcher, running = watcher
+    running[:] = [FakeProcess(200, "Game.exe", 2.0)]
+    assert watcher._check_new_processes() is not None
+    assert watcher._check_new_processes() is None
+
+
+def test_exit_wait_falls_back_to_polling_on_access_denied(watcher, monkeypatch):
+    watcher, running = watcher
+    processes_watcher = importlib.import_module("modules.processes_watcher")
+    monkeypatch.setattr(processes_watcher.time, "sleep", lambda _seconds: None)
+
+    class ElevatedProcess:
+        pid = 300
+        checks = 0
+
+        def wait(self):
+            raise processes_watcher.psutil.AccessDenied(self.pid)
+
+        def is_running(self):
+            # Процесс «завершается» на третьей проверке
+            self.checks += 1
+            return self.checks < 3
+
+    proc = ElevatedProcess()
+    watcher._wait_for_process_exit(proc, "Game.exe")
+    assert proc.checks == 3